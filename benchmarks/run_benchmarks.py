@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+台灣政府辦公日曆表效能測試
+完全離線執行：使用 data/*.csv 與 benchmarks/fixtures 中保存的 HTML 頁面，
+並將結果寫成 JSON，與 benchmarks/baseline.json 比較，退步時以非零狀態結束。
+
+用法：
+    python benchmarks/run_benchmarks.py                    # 執行並與基準比較
+    python benchmarks/run_benchmarks.py --update-baseline  # 重新產生基準檔
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import re
+import shutil
+import sys
+import tempfile
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+import yaml
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+FIXTURE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+SOURCE_DATA_DIR = os.path.join(REPO_ROOT, 'data')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, 'results.json')
+
+# 必須在匯入爬蟲模組前設定日誌，否則爬蟲的 basicConfig 會把每次測試都寫進 crawler.log
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('benchmarks')
+logger.setLevel(logging.INFO)
+
+sys.path.insert(0, REPO_ROOT)
+import taiwan_holiday_crawler  # noqa: E402
+from taiwan_holiday_crawler import TaiwanHolidayCrawler  # noqa: E402
+from data_converter import HolidayDataConverter  # noqa: E402
+
+# 合成資料的預設規模（年份數）
+DEFAULT_SCALE_YEARS = 300
+# 合成資料從民國 100 年（西元 2011 年）開始，民國年最多三位數
+SYNTHETIC_FIRST_ROC_YEAR = 100
+# 合成 CSV 以這個年份的資料為樣板
+TEMPLATE_YEAR = 2025
+
+
+class FakeResponse:
+    """模擬 requests.get 的回應物件"""
+
+    def __init__(self, content: bytes, encoding: str = 'utf-8'):
+        self.content = content
+        self.text = content.decode(encoding)
+
+    def raise_for_status(self):
+        pass
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """重複執行並記錄時間，以最小值作為比較依據以降低雜訊"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return {
+        'seconds': min(timings),
+        'mean_seconds': sum(timings) / len(timings),
+        'repeat': repeat,
+        'result': result
+    }
+
+
+def synthetic_index_html(first_roc_year: int, years: int) -> str:
+    """產生包含大量年份資源的資料集頁面"""
+    with open(os.path.join(FIXTURE_DIR, 'dataset_14718.html'), 'r', encoding='utf-8') as f:
+        page = f.read()
+
+    items = []
+    for roc_year in range(first_roc_year + years - 1, first_roc_year - 1, -1):
+        name = urllib.parse.quote(f"{roc_year}年中華民國政府行政機關辦公日曆表.csv")
+        google_name = urllib.parse.quote(f"{roc_year}年中華民國政府行政機關辦公日曆表(Google行事曆專用).csv")
+        items.append(
+            f'        <li class="resource-item">\n'
+            f'          <span class="resource-title">{roc_year}年中華民國政府行政機關辦公日曆表</span>\n'
+            f'          <a class="resource-download" href="https://www.dgpa.gov.tw/FileConversion?'
+            f'filename=dgpa/files/synthetic/{roc_year}.csv&amp;nfix=&amp;name={name}">下載</a>\n'
+            f'          <a class="resource-preview" href="/dataset/14718/resource/{roc_year}">'
+            f'{roc_year}年中華民國政府行政機關辦公日曆表 CSV 預覽</a>\n'
+            f'        </li>\n'
+            f'        <li class="resource-item">\n'
+            f'          <a class="resource-download" href="https://www.dgpa.gov.tw/FileConversion?'
+            f'filename=dgpa/files/synthetic/{roc_year}-google.csv&amp;nfix=&amp;name={google_name}">下載</a>\n'
+            f'        </li>'
+        )
+
+    # 以合成的資源清單取代快照中的資源清單
+    return re.sub(
+        r'(<section class="resources">\s*<ul>\n).*?(\s*</ul>\s*</section>)',
+        lambda m: m.group(1) + '\n'.join(items) + m.group(2),
+        page,
+        flags=re.S
+    )
+
+
+def synthetic_csv_text(year: int) -> str:
+    """以樣板年份的 CSV 產生指定年份的 CSV 內容"""
+    with open(os.path.join(SOURCE_DATA_DIR, f"taiwan_holidays_{TEMPLATE_YEAR}.csv"), 'r', encoding='utf-8-sig') as f:
+        content = f.read()
+    return re.sub(rf'^{TEMPLATE_YEAR}', str(year), content, flags=re.M)
+
+
+def fresh_dir(path: str):
+    """清空並重新建立目錄"""
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.makedirs(path)
+
+
+class BenchmarkSuite:
+    def __init__(self, workspace: str, repeat: int, scale_years: int):
+        self.workspace = workspace
+        self.repeat = repeat
+        self.scale_years = scale_years
+        self.real_csv_files = sorted(
+            f for f in os.listdir(SOURCE_DATA_DIR)
+            if f.startswith('taiwan_holidays_') and f.endswith('.csv')
+        )
+        self.synthetic_years = [
+            SYNTHETIC_FIRST_ROC_YEAR + 1911 + i for i in range(scale_years)
+        ]
+        self.synthetic_csv_dir = os.path.join(workspace, 'synthetic_csv')
+        fresh_dir(self.synthetic_csv_dir)
+        for year in self.synthetic_years:
+            path = os.path.join(self.synthetic_csv_dir, f"taiwan_holidays_{year}.csv")
+            with open(path, 'w', encoding='utf-8-sig') as f:
+                f.write(synthetic_csv_text(year))
+
+    def work_dir(self, name: str) -> str:
+        """每個測試項目使用獨立的 data 目錄"""
+        path = os.path.join(self.workspace, name)
+        fresh_dir(path)
+        return path
+
+    def populate(self, data_dir: str, synthetic: bool):
+        """將真實或合成的 CSV 複製到指定的 data 目錄"""
+        fresh_dir(data_dir)
+        if synthetic:
+            source_dir = self.synthetic_csv_dir
+            files = os.listdir(source_dir)
+        else:
+            source_dir = SOURCE_DATA_DIR
+            files = self.real_csv_files
+        for filename in files:
+            shutil.copy(os.path.join(source_dir, filename), data_dir)
+
+    def new_crawler(self, data_dir: str) -> TaiwanHolidayCrawler:
+        crawler = TaiwanHolidayCrawler()
+        crawler.data_dir = data_dir
+        crawler.ensure_data_dir()
+        return crawler
+
+    def new_converter(self, data_dir: str) -> HolidayDataConverter:
+        converter = HolidayDataConverter()
+        converter.data_dir = data_dir
+        return converter
+
+    # ---- 爬取 ----
+
+    def bench_index_parse(self, html: str, data_dir: str) -> Dict[str, Any]:
+        """get_available_years_and_urls 解析資料集頁面"""
+        crawler = self.new_crawler(data_dir)
+        response = FakeResponse(html.encode('utf-8'))
+        with mock.patch.object(taiwan_holiday_crawler.requests, 'get', return_value=response):
+            stats = measure(crawler.get_available_years_and_urls, self.repeat)
+        years = sorted(stats.pop('result'))
+        stats['checks'] = {
+            'years_found': len(years),
+            'first_year': years[0] if years else None,
+            'last_year': years[-1] if years else None
+        }
+        return stats
+
+    def bench_download(self, years: List[int], encoding: str, synthetic: bool, data_dir: str) -> Dict[str, Any]:
+        """download_year_data_direct 解碼並儲存 CSV"""
+        crawler = self.new_crawler(data_dir)
+        source_dir = self.synthetic_csv_dir if synthetic else SOURCE_DATA_DIR
+        payloads = {}
+        urls = {}
+        for year in years:
+            with open(os.path.join(source_dir, f"taiwan_holidays_{year}.csv"), 'r', encoding='utf-8-sig') as f:
+                text = f.read()
+            # 政府原始檔案常見為 Big5/CP950，UTF-8 則帶 BOM
+            if encoding == 'utf-8':
+                payloads[year] = ('\ufeff' + text).encode('utf-8')
+            else:
+                payloads[year] = text.encode(encoding)
+            name = urllib.parse.quote(f"{year - 1911}年中華民國政府行政機關辦公日曆表.csv")
+            urls[year] = f"https://www.dgpa.gov.tw/FileConversion?filename=bench/{year}.csv&nfix=&name={name}"
+
+        def fake_get(url, **kwargs):
+            year = int(urllib.parse.urlparse(url).query.split('bench/')[1].split('.')[0])
+            return FakeResponse(payloads[year], encoding)
+
+        def run():
+            return sum(crawler.download_year_data_direct(year, urls[year]) for year in years)
+
+        with mock.patch.object(taiwan_holiday_crawler.requests, 'get', side_effect=fake_get):
+            stats = measure(run, self.repeat)
+        stats['checks'] = {
+            'downloaded': stats.pop('result'),
+            'bytes_written': sum(
+                os.path.getsize(os.path.join(data_dir, f"taiwan_holidays_{year}.csv")) for year in years
+            )
+        }
+        return stats
+
+    # ---- 轉換 ----
+
+    def bench_convert_single(self, data_dir: str) -> Dict[str, Any]:
+        """convert_csv_to_yaml 轉換單一年份"""
+        self.populate(data_dir, synthetic=False)
+        converter = self.new_converter(data_dir)
+        csv_path = os.path.join(data_dir, f"taiwan_holidays_{TEMPLATE_YEAR}.csv")
+        stats = measure(lambda: converter.convert_csv_to_yaml(csv_path), self.repeat)
+        with open(os.path.join(data_dir, f"taiwan_holidays_{TEMPLATE_YEAR}.yml"), 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        stats['checks'] = {
+            'converted': stats.pop('result'),
+            'holidays': len(data['holidays']),
+            'special_working_days': len(data['special_working_days'])
+        }
+        return stats
+
+    def bench_convert_all(self, data_dir: str, synthetic: bool) -> Dict[str, Any]:
+        """convert_all_csv_files 轉換整個資料目錄"""
+        self.populate(data_dir, synthetic)
+        converter = self.new_converter(data_dir)
+        stats = measure(converter.convert_all_csv_files, self.repeat)
+        stats.pop('result')
+        stats['checks'] = {
+            'yaml_files': len([f for f in os.listdir(data_dir) if f.endswith('.yml')])
+        }
+        return stats
+
+    def bench_summary(self, data_dir: str) -> Dict[str, Any]:
+        """create_summary_yaml 彙整已轉換的 YAML（沿用 bench_convert_all 的輸出）"""
+        converter = self.new_converter(data_dir)
+        stats = measure(converter.create_summary_yaml, self.repeat)
+        stats.pop('result')
+        with open(os.path.join(data_dir, 'summary.yml'), 'r', encoding='utf-8') as f:
+            summary = yaml.safe_load(f)
+        stats['checks'] = {
+            'years': len(summary['available_years']),
+            'holidays_total': sum(y['holidays_count'] for y in summary['available_years'])
+        }
+        return stats
+
+    # ---- 查詢 ----
+
+    def bench_query(self, data_dir: str) -> Dict[str, Any]:
+        """依 README 範例載入 YAML 並查詢每一天是否放假"""
+        yaml_files = sorted(
+            f for f in os.listdir(data_dir) if f.endswith('.yml') and f != 'summary.yml'
+        )
+
+        def run():
+            days_off = 0
+            for yaml_file in yaml_files:
+                with open(os.path.join(data_dir, yaml_file), 'r', encoding='utf-8') as f:
+                    data = yaml.safe_load(f)
+                cal = {h['date']: h for h in data['holidays']}
+                year = data['year']
+                for month in range(1, 13):
+                    for day in range(1, 32):
+                        h = cal.get(f"{year}-{month:02d}-{day:02d}")
+                        if h and h['holiday'] == 1:
+                            days_off += 1
+            return days_off
+
+        stats = measure(run, self.repeat)
+        stats['checks'] = {'days_off': stats.pop('result')}
+        return stats
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        with open(os.path.join(FIXTURE_DIR, 'dataset_14718.html'), 'r', encoding='utf-8') as f:
+            snapshot_html = f.read()
+        real_years = [int(f[len('taiwan_holidays_'):-len('.csv')]) for f in self.real_csv_files]
+        scaled = f"synthetic_{self.scale_years}y"
+
+        cases = [
+            ('crawl.index_parse.snapshot',
+             lambda: self.bench_index_parse(snapshot_html, self.work_dir('index_snapshot'))),
+            (f'crawl.index_parse.{scaled}',
+             lambda: self.bench_index_parse(
+                 synthetic_index_html(SYNTHETIC_FIRST_ROC_YEAR, self.scale_years),
+                 self.work_dir('index_synthetic'))),
+            ('crawl.download.utf8',
+             lambda: self.bench_download(real_years, 'utf-8', False, self.work_dir('download_utf8'))),
+            ('crawl.download.big5',
+             lambda: self.bench_download(real_years, 'big5', False, self.work_dir('download_big5'))),
+            (f'crawl.download.{scaled}',
+             lambda: self.bench_download(self.synthetic_years, 'big5', True, self.work_dir('download_synthetic'))),
+            ('convert.csv_to_yaml',
+             lambda: self.bench_convert_single(self.work_dir('convert_single'))),
+            ('convert.all_csv_files',
+             lambda: self.bench_convert_all(self.work_dir('convert_real'), synthetic=False)),
+            ('convert.summary_yaml',
+             lambda: self.bench_summary(os.path.join(self.workspace, 'convert_real'))),
+            ('query.is_day_off',
+             lambda: self.bench_query(os.path.join(self.workspace, 'convert_real'))),
+            (f'convert.all_csv_files.{scaled}',
+             lambda: self.bench_convert_all(self.work_dir('convert_synthetic'), synthetic=True)),
+            (f'convert.summary_yaml.{scaled}',
+             lambda: self.bench_summary(os.path.join(self.workspace, 'convert_synthetic'))),
+            (f'query.is_day_off.{scaled}',
+             lambda: self.bench_query(os.path.join(self.workspace, 'convert_synthetic'))),
+        ]
+
+        results = {}
+        for name, case in cases:
+            results[name] = case()
+            logger.info(f"{name}: {results[name]['seconds'] * 1000:.2f} ms")
+        return results
+
+
+def compare_with_baseline(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any],
+                          tolerance: float, min_delta: float) -> List[str]:
+    """與基準比較，回傳所有退步或結果不符的項目"""
+    failures = []
+    for name, expected in baseline['results'].items():
+        actual = results.get(name)
+        if actual is None:
+            failures.append(f"{name}: 基準中有此項目但本次未執行")
+            continue
+
+        if actual['checks'] != expected['checks']:
+            failures.append(f"{name}: 結果不符，基準 {expected['checks']}，本次 {actual['checks']}")
+
+        limit = expected['seconds'] * tolerance
+        if actual['seconds'] > limit and actual['seconds'] - expected['seconds'] > min_delta:
+            failures.append(
+                f"{name}: 效能退步 {actual['seconds'] * 1000:.2f} ms "
+                f"> 基準 {expected['seconds'] * 1000:.2f} ms x {tolerance}"
+            )
+    return failures
+
+
+def main():
+    """主程式進入點"""
+    parser = argparse.ArgumentParser(description='台灣政府辦公日曆表離線效能測試')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='結果 JSON 輸出路徑')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='基準 JSON 路徑')
+    parser.add_argument('--update-baseline', action='store_true', help='以本次結果覆寫基準檔')
+    parser.add_argument('--repeat', type=int, default=3, help='每個項目重複執行次數（取最小值）')
+    parser.add_argument('--scale-years', type=int, default=DEFAULT_SCALE_YEARS,
+                        help='合成資料的年份數（最多 900）')
+    parser.add_argument('--tolerance', type=float, default=1.5, help='允許的耗時倍數')
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help='耗時增加低於此秒數時不視為退步')
+    args = parser.parse_args()
+
+    if not 1 <= args.scale_years <= 1000 - SYNTHETIC_FIRST_ROC_YEAR:
+        parser.error(f"--scale-years 必須介於 1 到 {1000 - SYNTHETIC_FIRST_ROC_YEAR}")
+
+    print("⏱️  開始執行離線效能測試...")
+
+    workspace = tempfile.mkdtemp(prefix='taiwan_holiday_bench_')
+    cwd = os.getcwd()
+    try:
+        # 爬蟲與轉換器都使用相對路徑 data，切換到暫存目錄以免動到專案資料
+        os.chdir(workspace)
+        suite = BenchmarkSuite(workspace, args.repeat, args.scale_years)
+        results = suite.run()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    report = {
+        'generated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'scale_years': args.scale_years,
+        'results': results
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    logger.info(f"結果已寫入: {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✅ 已更新基準檔: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        logger.error(f"找不到基準檔: {args.baseline}，請先使用 --update-baseline 產生")
+        sys.exit(1)
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    if baseline.get('scale_years') != args.scale_years:
+        logger.error(f"合成資料規模不同：基準為 {baseline.get('scale_years')} 年，本次為 {args.scale_years} 年")
+        sys.exit(1)
+
+    failures = compare_with_baseline(results, baseline, args.tolerance, args.min_delta)
+    if failures:
+        for failure in failures:
+            logger.error(failure)
+        print(f"❌ 效能測試失敗：{len(failures)} 個項目退步或結果不符")
+        sys.exit(1)
+
+    print("✅ 效能測試通過，未發現退步")
+
+
+if __name__ == "__main__":
+    main()